@@ -1,48 +1,141 @@
+import asyncio
+import atexit
+import logging
+import os
 from psycopg import connect, Connection, OperationalError
-from psycopg_pool import ConnectionPool
+from psycopg_pool import AsyncConnectionPool, ConnectionPool, PoolTimeout
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
 @dataclass(frozen=True)
 class TimescaleConfig:
     dbname: str = "daq_data"
     user: str = "fsae"
     host: str = "localhost"
     port: int = 5432
+    socket_dir: str = "/var/run/postgresql" # Unix socket directory, shared with the timescaledb container
+    use_socket: bool = False
 
     def to_str(self) -> str:
-        return f"dbname={self.dbname} user={self.user} host={self.host} port={self.port}"
+        # The socket is opt-in so a local PostgreSQL on a dev machine is never picked up instead of the docker one
+        host = self.socket_dir if self.use_socket else self.host
+        return f"dbname={self.dbname} user={self.user} host={host} port={self.port}"
+
+# DB_USE_SOCKET=1 is only set inside docker-compose, where the socket volume is mounted
+DB_CONFIG = TimescaleConfig(use_socket=os.environ.get("DB_USE_SOCKET") == "1")
+DB_CONNINFO = DB_CONFIG.to_str() # built once; DB_CONFIG is frozen
+
+# Prepare every statement on first use; the insert path reuses the same few SQL strings.
+PREPARE_THRESHOLD = 0
+PREPARED_MAX = 32
+
+# Seconds a new pool may take to make its first min_size connections before we give up
+POOL_OPEN_TIMEOUT = 10
+
+def _configure(conn: Connection):
+    conn.prepared_max = PREPARED_MAX
 
-DB_CONFIG = TimescaleConfig()
+async def _configure_async(conn):
+    conn.prepared_max = PREPARED_MAX
+
+def _log_connection_error(e: OperationalError):
+    logger.exception('psycopg error')
+    if 'Is the server running' in str(e):
+        logger.error('Is docker running/connected?')
 
 def get_connection() -> Connection | None:
     try:
-        conn = connect(DB_CONFIG.to_str())
-        #print("Connection successfully established")
+        conn = connect(DB_CONNINFO, prepare_threshold=PREPARE_THRESHOLD)
+        _configure(conn)
         return conn
     except OperationalError as e:
-        print(f'psycopg error: {e}')
-        if 'Is the server running on that host and accepting TCP/IP connections?' in str(e):
-            print('\nIs docker running/connected?')
+        _log_connection_error(e)
         return None
 
-def get_connection_pool(min_size: int = 1, max_size: int = 10) -> ConnectionPool | None:
+_POOL: ConnectionPool | None = None
+
+def get_connection_pool(min_size: int | None = None, max_size: int | None = None) -> ConnectionPool | None:
+    # One pool per process; later calls return the same pool (sizes only apply on first call).
+    global _POOL
+    if _POOL is not None:
+        return _POOL
+
+    cpu_count = os.cpu_count() or 1
+    min_size = min_size or cpu_count
+    max_size = max(max_size or cpu_count * 2, min_size)
+    pool = ConnectionPool(
+        DB_CONNINFO,
+        min_size=min_size,
+        max_size=max_size,
+        kwargs={"prepare_threshold": PREPARE_THRESHOLD},
+        configure=_configure,
+        open=True,
+    )
     try:
-        pool = ConnectionPool(DB_CONFIG.to_str(), min_size=min_size, max_size=max_size)
-        #print("Connection Pool created")
-        return pool
-    except OperationalError as e:
-        print(f'psycopg error: {e}')
-        if 'Is the server running on that host and accepting TCP/IP connections?' in str(e):
-            print('\nIs docker running/connected?')
+        # Opening never fails by itself (the pool keeps retrying in the background),
+        # so wait for the first connections to find out whether the database is reachable
+        pool.wait(timeout=POOL_OPEN_TIMEOUT)
+    except PoolTimeout:
+        logger.error('Could not connect to the database within %s seconds', POOL_OPEN_TIMEOUT)
+        logger.error('Is docker running/connected?')
+        pool.close()
         return None
 
+    atexit.register(pool.close)
+    _POOL = pool
+    return pool
+
+_ASYNC_POOL: AsyncConnectionPool | None = None
+_ASYNC_POOL_LOCK = asyncio.Lock() # open() awaits, so concurrent first callers must not each build a pool
+
+async def get_async_connection_pool(min_size: int | None = None, max_size: int | None = None) -> AsyncConnectionPool | None:
+    # Async counterpart of get_connection_pool; close it with close_async_connection_pool() before the loop ends.
+    global _ASYNC_POOL
+    if _ASYNC_POOL is not None:
+        return _ASYNC_POOL
+
+    async with _ASYNC_POOL_LOCK:
+        if _ASYNC_POOL is not None:
+            return _ASYNC_POOL
+
+        cpu_count = os.cpu_count() or 1
+        min_size = min_size or cpu_count
+        max_size = max(max_size or cpu_count * 2, min_size)
+        pool = AsyncConnectionPool(
+            DB_CONNINFO,
+            min_size=min_size,
+            max_size=max_size,
+            kwargs={"prepare_threshold": PREPARE_THRESHOLD},
+            configure=_configure_async,
+            open=False,
+        )
+        try:
+            await pool.open(wait=True, timeout=POOL_OPEN_TIMEOUT)
+        except PoolTimeout:
+            logger.error('Could not connect to the database within %s seconds', POOL_OPEN_TIMEOUT)
+            logger.error('Is docker running/connected?')
+            await pool.close()
+            return None
+
+        _ASYNC_POOL = pool
+        return pool
+
+async def close_async_connection_pool():
+    global _ASYNC_POOL
+    async with _ASYNC_POOL_LOCK:
+        if _ASYNC_POOL is None:
+            return
+
+        await _ASYNC_POOL.close()
+        _ASYNC_POOL = None
+
 def close_connection(conn: Connection | None):
     if conn is None:
-        print('Connection not found')
+        logger.warning('Connection not found')
         return
 
     conn.close()
-    #print('Connection closed')
 
 def test_connection() -> bool:
     print('Testing Connection ...')
@@ -52,11 +145,11 @@ def test_connection() -> bool:
             return False
         
     try:
-        #print('Running SELECT 1')
         conn.execute("SELECT 1")
         close_connection(conn)
         print('Connection accessible')
         return True
-    except OperationalError as e:
-        print(f"psycopg error: {e}", "Connection failed")
+    except OperationalError:
+        logger.exception('psycopg error')
+        print('Connection failed')
         return False
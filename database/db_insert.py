@@ -1,56 +1,167 @@
-from datetime import datetime
+import time
+from collections import deque
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from functools import lru_cache
 
 import psycopg
 
+# Batches smaller than this skip the COPY staging round-trips.
+COPY_THRESHOLD = 200
+
 INSERT_SQL = """
 INSERT INTO sensor_readings (timestamp, session_id, vehicle_id, sensor_name, value)
 VALUES (%s, %s, %s, %s, %s)
 ON CONFLICT DO NOTHING;
 """
 
+# The stage table lives until the transaction commits, so several COPY flushes can share it.
+STAGE_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS sensor_readings_stage (LIKE sensor_readings INCLUDING DEFAULTS) ON COMMIT DROP;
+"""
+
+# Binary COPY: values go over the wire in their PostgreSQL binary form, so the server does no text parsing.
+COPY_SQL = """
+COPY sensor_readings_stage (timestamp, session_id, vehicle_id, sensor_name, value) FROM STDIN (FORMAT BINARY)
+"""
+COPY_TYPES = ('timestamptz', 'text', 'text', 'text', 'float8')
+
+MERGE_SQL = """
+WITH staged AS (
+    DELETE FROM sensor_readings_stage
+    RETURNING timestamp, session_id, vehicle_id, sensor_name, value
+)
+INSERT INTO sensor_readings (timestamp, session_id, vehicle_id, sensor_name, value)
+SELECT timestamp, session_id, vehicle_id, sensor_name, value FROM staged
+ON CONFLICT DO NOTHING;
+"""
+
+
+REQUIRED_FIELDS = ('timestamp', 'session_id', 'vehicle_id', 'sensor_name', 'value')
+
+
+def _as_utc(timestamp):
+    # Binary timestamptz is an absolute instant, so naive values are taken as UTC
+    # (the session time zone of the timescaledb container).
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+# Every row of a packet carries the same timestamp string, so parse each one once.
+@lru_cache(maxsize=1024)
+def _parse_timestamp(timestamp_str):
+    iso = timestamp_str.strip()
+    if iso.endswith('Z'):
+        iso = iso[:-1] + '+00:00'
+    return _as_utc(datetime.fromisoformat(iso))
+
 
 def _to_datetime(timestamp_value):
-    if isinstance(timestamp_value, datetime):
-        return timestamp_value
+    if type(timestamp_value) is datetime:
+        return _as_utc(timestamp_value)
     if isinstance(timestamp_value, str):
-        iso = timestamp_value.strip()
-        if iso.endswith('Z'):
-            iso = iso[:-1] + '+00:00'
-        return datetime.fromisoformat(iso)
+        return _parse_timestamp(timestamp_value)
+    if isinstance(timestamp_value, datetime):
+        return _as_utc(timestamp_value)
     return timestamp_value
 
 
-def _normalize_row(data):
-    if not isinstance(data, dict):
-        return None, 'Sensor data must be a dictionary.'
+def _nonempty_str(value):
+    return type(value) is str and bool(value) and not value.isspace()
+
 
-    required_fields = ['timestamp', 'session_id', 'vehicle_id', 'sensor_name', 'value']
-    missing = [field for field in required_fields if field not in data]
-    if missing:
-        return None, f"Missing required field(s): {', '.join(missing)}."
+def _normalize_row(data):
+    # Rows from parser.format() are tuples in REQUIRED_FIELDS order.
+    if type(data) is tuple:
+        if len(data) != len(REQUIRED_FIELDS):
+            return None, f"Sensor row must have {len(REQUIRED_FIELDS)} fields: {', '.join(REQUIRED_FIELDS)}."
+        timestamp_value, session_id, vehicle_id, sensor_name, value = data
+    elif isinstance(data, dict):
+        # Read the fields optimistically; only work out which ones are missing on failure.
+        try:
+            timestamp_value = data['timestamp']
+            session_id = data['session_id']
+            vehicle_id = data['vehicle_id']
+            sensor_name = data['sensor_name']
+            value = data['value']
+        except KeyError:
+            missing = [field for field in REQUIRED_FIELDS if field not in data]
+            return None, f"Missing required field(s): {', '.join(missing)}."
+    else:
+        return None, 'Sensor data must be a dictionary or tuple.'
 
     try:
-        timestamp = _to_datetime(data['timestamp'])
+        timestamp = _to_datetime(timestamp_value)
     except Exception as e:
         return None, f'Invalid timestamp: {e}'
 
-    if not isinstance(data['session_id'], str) or not data['session_id'].strip():
+    if not _nonempty_str(session_id):
         return None, 'session_id must be a non-empty string.'
-    if not isinstance(data['vehicle_id'], str) or not data['vehicle_id'].strip():
+    if not _nonempty_str(vehicle_id):
         return None, 'vehicle_id must be a non-empty string.'
-    if not isinstance(data['sensor_name'], str) or not data['sensor_name'].strip():
+    if not _nonempty_str(sensor_name):
         return None, 'sensor_name must be a non-empty string.'
-    if isinstance(data['value'], bool) or not isinstance(data['value'], (int, float)):
+    if type(value) is not float and (isinstance(value, bool) or not isinstance(value, (int, float))):
         return None, 'value must be numeric.'
 
-    row = (
-        timestamp,
-        data['session_id'],
-        data['vehicle_id'],
-        data['sensor_name'],
-        data['value'],
-    )
-    return row, None
+    return (timestamp, session_id, vehicle_id, sensor_name, value), None
+
+
+def _normalize_batch(data_list):
+    if not isinstance(data_list, list) or not data_list:
+        return None, 'Batch insert failed: data_list must be a non-empty list.'
+
+    rows = []
+    for index, data in enumerate(data_list):
+        row, error = _normalize_row(data)
+        if error:
+            return None, f'Row {index}: {error}'
+        rows.append(row)
+    return rows, None
+
+
+def _pipeline(conn):
+    # Pipeline mode needs libpq >= 14; older clients fall back to plain round-trips.
+    if psycopg.Pipeline.is_supported():
+        return conn.pipeline()
+    return nullcontext()
+
+
+def _write_rows(cur, rows):
+    if len(rows) < COPY_THRESHOLD:
+        with _pipeline(cur.connection):
+            cur.executemany(INSERT_SQL, rows)
+    else:
+        # COPY into a staging table, then merge so duplicates are still skipped.
+        cur.execute(STAGE_SQL)
+        with cur.copy(COPY_SQL) as copy:
+            copy.set_types(COPY_TYPES)
+            for row in rows:
+                copy.write_row(row)
+        cur.execute(MERGE_SQL)
+    return cur.rowcount
+
+
+def _batch_result(rows, inserted_count):
+    skipped_count = len(rows) - inserted_count
+    return True, f'Batch insert complete: inserted {inserted_count}, skipped {skipped_count} duplicates.'
+
+
+def _insert_rows(conn, rows, commit=True):
+    try:
+        with conn.cursor() as cur:
+            inserted_count = _write_rows(cur, rows)
+        if commit:
+            conn.commit()
+    except Exception as e:
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        return handle_insert_error(e)
+
+    return _batch_result(rows, inserted_count)
 
 
 def handle_insert_error(error):
@@ -65,7 +176,7 @@ def handle_insert_error(error):
     return False, f'Insert failed: {error}'
 
 
-def insert_single(conn, data):
+def insert_single(conn, data, commit=True):
     if conn is None:
         return False, 'Insert failed: connection object is None.'
 
@@ -75,9 +186,10 @@ def insert_single(conn, data):
 
     try:
         with conn.cursor() as cur:
-            cur.execute(INSERT_SQL, row)
+            cur.execute(INSERT_SQL, row, prepare=True)
             inserted_count = cur.rowcount
-        conn.commit()
+        if commit:
+            conn.commit()
 
         if inserted_count == 1:
             return True, 'Inserted 1 sensor reading.'
@@ -90,33 +202,114 @@ def insert_single(conn, data):
         return handle_insert_error(e)
 
 
-def insert_batch(conn, data_list):
+def insert_batch(conn, data_list, commit=True):
     if conn is None:
         return False, 'Batch insert failed: connection object is None.'
-    if not isinstance(data_list, list) or not data_list:
-        return False, 'Batch insert failed: data_list must be a non-empty list.'
 
-    rows = []
-    for index, data in enumerate(data_list):
-        row, error = _normalize_row(data)
-        if error:
-            return False, f'Row {index}: {error}'
-        rows.append(row)
+    rows, error = _normalize_batch(data_list)
+    if error:
+        return False, error
 
-    inserted_count = 0
-    try:
-        with conn.cursor() as cur:
-            for row in rows:
-                cur.execute(INSERT_SQL, row)
-                if cur.rowcount == 1:
-                    inserted_count += 1
-        conn.commit()
-    except Exception as e:
+    return _insert_rows(conn, rows, commit)
+
+
+def insert_batch_raw(conn, rows, commit=True):
+    # Trusted fast path: rows must already be (timestamp, session_id, vehicle_id, sensor_name, value)
+    # tuples with a timezone-aware datetime timestamp, e.g. parser.format()['sensors'].
+    # No validation is done here.
+    if conn is None:
+        return False, 'Batch insert failed: connection object is None.'
+    if not rows:
+        return False, 'Batch insert failed: rows must be a non-empty sequence.'
+
+    return _insert_rows(conn, rows, commit)
+
+
+class Ingester:
+    # Buffers trusted rows (see insert_batch_raw) on one long-lived connection and cursor,
+    # and writes + commits them together once max_rows or flush_interval_ms is reached.
+    # There is no background timer: flush_interval_ms is only checked inside add(), so
+    # call flush() (or close()) yourself when rows stop arriving.
+    #
+    # When a flush fails with an OperationalError (lost connection, deadlock, ...) the rows
+    # stay buffered and are retried on the next flush, keeping at most max_buffered_rows
+    # (the oldest rows are dropped beyond that). If the connection itself is gone
+    # (conn.broken / conn.closed), retries can't succeed until reconnect() is called with a
+    # new connection. Any other error (DataError, IntegrityError, ...) would fail again on
+    # retry, so those rows are dropped and reported in the returned message.
+    def __init__(self, conn, flush_interval_ms=100, max_rows=10_000, synchronous_commit=False, max_buffered_rows=None):
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_rows = max_rows
+        self.max_buffered_rows = max_buffered_rows or max_rows * 10
+        self.synchronous_commit = synchronous_commit
+        self._rows = deque()
+        self._last_flush = time.monotonic()
+        self._attach(conn)
+
+    def _attach(self, conn):
+        self.conn = conn
+        self._cur = conn.cursor()
+
+        if not self.synchronous_commit:
+            # Telemetry can afford to lose the last few commits on a server crash,
+            # so COMMIT doesn't wait for the WAL flush on this session.
+            self._cur.execute('SET SESSION synchronous_commit = OFF')
+            conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def reconnect(self, conn):
+        # Swap in a new connection after the old one was lost; buffered rows are kept.
         try:
-            conn.rollback()
+            self._cur.close()
         except Exception:
             pass
-        return handle_insert_error(e)
+        self._attach(conn)
 
-    skipped_count = len(rows) - inserted_count
-    return True, f'Batch insert complete: inserted {inserted_count}, skipped {skipped_count} duplicates.'
+    def add(self, rows):
+        self._rows.extend(rows)
+        if len(self._rows) >= self.max_rows or time.monotonic() - self._last_flush >= self.flush_interval:
+            return self.flush()
+        return True, 'Rows buffered.'
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+        if not self._rows:
+            return True, 'Nothing to flush.'
+
+        rows, self._rows = self._rows, deque()
+        try:
+            inserted_count = _write_rows(self._cur, rows)
+            self.conn.commit()
+        except Exception as e:
+            try:
+                self.conn.rollback()
+            except Exception:
+                pass
+            ok, message = handle_insert_error(e)
+            if not isinstance(e, psycopg.OperationalError):
+                return ok, f'{message}; dropped {len(rows)} rows.'
+
+            # Put the rows back in front of anything added since, keeping their order
+            self._rows.extendleft(reversed(rows))
+            dropped_count = len(self._rows) - self.max_buffered_rows
+            for _ in range(dropped_count):
+                self._rows.popleft()
+            message = f'{message}; {len(self._rows)} rows kept for retry'
+            if dropped_count > 0:
+                message += f', dropped {dropped_count} oldest rows'
+            if self.conn.broken or self.conn.closed:
+                message += ' (connection lost, call reconnect())'
+            return ok, message + '.'
+
+        skipped_count = len(rows) - inserted_count
+        return True, f'Flush complete: inserted {inserted_count}, skipped {skipped_count} duplicates.'
+
+    def close(self):
+        result = self.flush()
+        self._cur.close()
+        return result
@@ -0,0 +1,76 @@
+import asyncio
+
+from database.db_insert import (
+    COPY_SQL,
+    COPY_THRESHOLD,
+    COPY_TYPES,
+    INSERT_SQL,
+    MERGE_SQL,
+    STAGE_SQL,
+    _batch_result,
+    _normalize_batch,
+    _pipeline,
+    handle_insert_error,
+)
+
+
+async def _write_rows_async(cur, rows):
+    if len(rows) < COPY_THRESHOLD:
+        async with _pipeline(cur.connection):
+            await cur.executemany(INSERT_SQL, rows)
+    else:
+        # COPY into a staging table, then merge so duplicates are still skipped.
+        await cur.execute(STAGE_SQL)
+        async with cur.copy(COPY_SQL) as copy:
+            copy.set_types(COPY_TYPES)
+            for row in rows:
+                await copy.write_row(row)
+        await cur.execute(MERGE_SQL)
+    return cur.rowcount
+
+
+async def _insert_rows_async(aconn, rows, commit=True):
+    try:
+        async with aconn.cursor() as cur:
+            inserted_count = await _write_rows_async(cur, rows)
+        if commit:
+            await aconn.commit()
+    except Exception as e:
+        try:
+            await aconn.rollback()
+        except Exception:
+            pass
+        return handle_insert_error(e)
+
+    return _batch_result(rows, inserted_count)
+
+
+async def insert_batch_async(aconn, data_list, commit=True):
+    if aconn is None:
+        return False, 'Batch insert failed: connection object is None.'
+
+    rows, error = _normalize_batch(data_list)
+    if error:
+        return False, error
+
+    return await _insert_rows_async(aconn, rows, commit)
+
+
+async def insert_batch_raw_async(aconn, rows, commit=True):
+    # Same contract as db_insert.insert_batch_raw: trusted rows, no validation.
+    if aconn is None:
+        return False, 'Batch insert failed: connection object is None.'
+    if not rows:
+        return False, 'Batch insert failed: rows must be a non-empty sequence.'
+
+    return await _insert_rows_async(aconn, rows, commit)
+
+
+async def insert_many_async(pool, row_groups):
+    # Write each group of trusted rows on its own pooled connection so their
+    # round-trips and commits overlap. Returns one (ok, message) per group.
+    async def insert_group(rows):
+        async with pool.connection() as aconn:
+            return await insert_batch_raw_async(aconn, rows)
+
+    return await asyncio.gather(*(insert_group(rows) for rows in row_groups))
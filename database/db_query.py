@@ -1,8 +1,10 @@
+import logging
 import psycopg
 from psycopg.rows import dict_row
 from psycopg import sql
 from datetime import datetime
-# import logging
+
+logger = logging.getLogger(__name__)
 
 def get_by_time_range(conn, start_time, end_time, table_name='sensor_readings'): #defaults to using 'sensor_readings' table
     query = sql.SQL("SELECT * FROM {} WHERE timestamp >= %s AND timestamp <= %s;").format(sql.Identifier(table_name))
@@ -12,8 +14,8 @@ def get_by_time_range(conn, start_time, end_time, table_name='sensor_readings'):
             cur.execute(query, (start_time, end_time)) #execute expects tuple/list
             times_result = cur.fetchall()
             return times_result
-    except Exception as e:
-        print(f"Error in get_by_time_range(): {e}")
+    except Exception:
+        logger.exception("Error in get_by_time_range()")
         return None
 
 
@@ -29,33 +31,39 @@ def get_sensor_reading(conn, sensor_name, timestamp, table_name='sensor_readings
                 return sensor_result['value']
             else:
                 return None
-    except Exception as e:
-        print(f"Error in get_sensor_reading(): {e}")
+    except Exception:
+        logger.exception("Error in get_sensor_reading()")
         return None
 
 def verify_insertion(conn, timestamp, table_name='sensor_readings'): 
-    query = sql.SQL("SELECT 1 FROM {} WHERE timestamp = %s;").format(sql.Identifier(table_name))
+    # EXISTS stops at the first matching row and always returns exactly one boolean
+    query = sql.SQL("SELECT EXISTS (SELECT 1 FROM {} WHERE timestamp = %s);").format(sql.Identifier(table_name))
 
     try:
         with conn.cursor() as cur:
-            cur.execute(query,(timestamp,)) #execute expects tuple/list
-            if cur.fetchone():
-                return True
-    except Exception as e:
-        print(f"Error in verify_insertion(): {e}")
+            cur.execute(query, (timestamp,), prepare=True) #execute expects tuple/list
+            return cur.fetchone()[0]
+    except Exception:
+        logger.exception("Error in verify_insertion()")
         return False
 
-def count_records(conn, table_name='sensor_readings'):
-    query = sql.SQL("SELECT COUNT(*) as total from {};").format(sql.Identifier(table_name))
+def count_records(conn, table_name='sensor_readings', exact=False):
+    if exact:
+        query = sql.SQL("SELECT COUNT(*) as total from {};").format(sql.Identifier(table_name))
+        params = None
+    else:
+        # TimescaleDB estimate from catalog statistics instead of scanning every chunk
+        # regclass parses the name like SQL would, so pass it quoted to keep case and dots literal
+        query = sql.SQL("SELECT approximate_row_count(%s::regclass) as total;")
+        params = (sql.Identifier(table_name).as_string(conn),)
 
     try:
         with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(query)
+            cur.execute(query, params)
             record_count = cur.fetchone()
             if record_count:
                 return record_count['total']
 
-    except Exception as e:
-        print(f"Error in count_records(): {e}")
+    except Exception:
+        logger.exception("Error in count_records()")
         return 0
-    
@@ -3,8 +3,8 @@ import sys
 from pathlib import Path
 
 try:
-    from database.db_connection import close_connection, get_connection
-    from database.db_insert import insert_batch, insert_single
+    from database.db_connection import get_connection_pool
+    from database.db_insert import insert_batch_raw, insert_single
     from parser.parser import format, parse
 except ModuleNotFoundError as e:
     if e.name != 'database':
@@ -14,8 +14,8 @@ except ModuleNotFoundError as e:
     if str(repo_root) not in sys.path:
         sys.path.insert(0, str(repo_root))
 
-    from database.db_connection import close_connection, get_connection
-    from database.db_insert import insert_batch, insert_single
+    from database.db_connection import get_connection_pool
+    from database.db_insert import insert_batch_raw, insert_single
     from parser.parser import format, parse
 
 
@@ -25,12 +25,12 @@ def load_payload(path):
 
 
 def main():
-    conn = get_connection()
-    if conn is None:
-        print('Could not create database connection.')
+    pool = get_connection_pool()
+    if pool is None:
+        print('Could not create database connection pool.')
         return
 
-    try:
+    with pool.connection() as conn:
         payload_a = load_payload('test_data/20220204_142345.json')
         payload_b = load_payload('test_data/20220204_142412.json')
 
@@ -41,10 +41,8 @@ def main():
         print('insert_single:', ok, message)
 
         sensor_rows = formatted_a['sensors'] + formatted_b['sensors']
-        ok, message = insert_batch(conn, sensor_rows)
-        print('insert_batch:', ok, message)
-    finally:
-        close_connection(conn)
+        ok, message = insert_batch_raw(conn, sensor_rows)
+        print('insert_batch_raw:', ok, message)
 
 
 if __name__ == '__main__':
@@ -28,8 +28,12 @@ CREATE TABLE IF NOT EXISTS sensor_readings (
 
 -- TimescaleDB Hypertable Setup
 SELECT create_hypertable('packets', 'timestamp', if_not_exists => TRUE);
-SELECT create_hypertable('sensor_readings', 'timestamp', if_not_exists => TRUE);
+-- sensor_readings is also space-partitioned by sensor_name so writes spread across per-partition chunk indexes
+SELECT create_hypertable('sensor_readings', 'timestamp', partitioning_column => 'sensor_name', number_partitions => 16, if_not_exists => TRUE);
 
 -- Indexes for performance
 CREATE INDEX idx_packets_session ON packets(session_id, timestamp DESC);
-CREATE INDEX idx_readings_sensor_time ON sensor_readings(sensor_name, timestamp DESC);
\ No newline at end of file
+CREATE INDEX idx_readings_sensor_time ON sensor_readings(sensor_name, timestamp DESC);
+
+-- Physically order each chunk by (sensor_name, timestamp) once it stops receiving writes (per-chunk CLUSTER)
+SELECT add_reorder_policy('sensor_readings', 'idx_readings_sensor_time', if_not_exists => TRUE);
\ No newline at end of file
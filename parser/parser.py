@@ -1,18 +1,56 @@
 import json
-from datetime import datetime
+import sys
+from datetime import datetime, timezone
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _loads(json_text):
+        return orjson.loads(json_text)
+
+    def _dumps(payload):
+        return orjson.dumps(payload).decode()
+else:
+    def _loads(json_text):
+        return json.loads(json_text)
+
+    def _dumps(payload):
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+# Column order of the sensor row tuples produced by format().
+SENSOR_ROW_FIELDS = ("timestamp", "session_id", "vehicle_id", "sensor_name", "value")
+
+def _as_utc(timestamp):
+    # Timestamps are stored as timestamptz; treat naive values as UTC so rows can be
+    # sent with binary COPY (see db_insert.insert_batch_raw).
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11 on.
+_FROMISOFORMAT_HANDLES_Z = sys.version_info >= (3, 11)
+
+def _parse_iso(timestamp_str):
+    iso = timestamp_str.strip()
+    if not _FROMISOFORMAT_HANDLES_Z and iso.endswith("Z"):
+        iso = iso[:-1] + "+00:00"
+    return _as_utc(datetime.fromisoformat(iso))
 
 def _to_datetime(timestamp_value):
+    # Payload timestamps are almost always ISO strings, so check for that first.
+    if type(timestamp_value) is str:
+        return _parse_iso(timestamp_value)
     if timestamp_value is None:
         return None
     if isinstance(timestamp_value, datetime):
-        return timestamp_value
+        return _as_utc(timestamp_value)
     if isinstance(timestamp_value, (int, float)):
-        return datetime.fromtimestamp(timestamp_value)
+        return datetime.fromtimestamp(timestamp_value, tz=timezone.utc)
     if isinstance(timestamp_value, str):
-        iso = timestamp_value.strip()
-        if iso.endswith("Z"):
-            iso = iso[:-1] + "+00:00"
-        return datetime.fromisoformat(iso)
+        return _parse_iso(timestamp_value)
     raise ValueError("unsupported timestamp format")
 
 def extract_sensors(payload):
@@ -24,12 +62,18 @@ def extract_metadata(payload):
     return metadata_map if isinstance(metadata_map, dict) else {}
 
 def parse(json_data):
+    # Keep the text we were given so format() can forward it instead of re-serializing.
     if isinstance(json_data, str):
-        payload = json.loads(json_data)
+        payload = _loads(json_data)
+        raw_json = json_data
+    elif isinstance(json_data, (bytes, bytearray)):
+        payload = _loads(json_data)
+        raw_json = json_data.decode("utf-8")
     elif isinstance(json_data, dict):
         payload = json_data
+        raw_json = None
     else:
-        raise ValueError("json_data must be dict or json string")
+        raise ValueError("json_data must be dict, json string or json bytes")
 
     return {
         "timestamp": _to_datetime(payload.get("timestamp")),
@@ -38,10 +82,12 @@ def parse(json_data):
         "sensors": extract_sensors(payload),
         "telemetry_metadata": extract_metadata(payload),
         "raw_payload": payload,
+        "raw_json": raw_json,
     }
 
 def format(parsed_payload):
     raw_payload = parsed_payload.get("raw_payload") or {}
+    raw_json = parsed_payload.get("raw_json")
     telemetry_metadata = parsed_payload.get("telemetry_metadata") or {}
     sensor_map = parsed_payload.get("sensors") or {}
 
@@ -49,24 +95,19 @@ def format(parsed_payload):
         "timestamp": parsed_payload.get("timestamp"),
         "session_id": parsed_payload.get("session_id"),
         "vehicle_id": parsed_payload.get("vehicle_id"),
-        "raw_payload": json.dumps(raw_payload, separators=(",", ":"), ensure_ascii=False),
+        "raw_payload": raw_json if raw_json is not None else _dumps(raw_payload),
     }
 
     for key, value in telemetry_metadata.items():
         packet_row[key] = value
 
-    sensor_rows = []
     packet_timestamp = packet_row["timestamp"]
     session_id = packet_row["session_id"]
     vehicle_id = packet_row["vehicle_id"]
 
-    for sensor_name, reading_value in sensor_map.items():
-        sensor_rows.append({
-            "timestamp": packet_timestamp,
-            "session_id": session_id,
-            "vehicle_id": vehicle_id,
-            "sensor_name": sensor_name,
-            "value": reading_value,
-        })
+    sensor_rows = [
+        (packet_timestamp, session_id, vehicle_id, sensor_name, reading_value)
+        for sensor_name, reading_value in sensor_map.items()
+    ]
 
     return {"packet": packet_row, "sensors": sensor_rows}
@@ -1,6 +1,6 @@
 import json
-from datetime import datetime
-from parser import parse, format
+from datetime import datetime, timezone
+from parser import parse, format, SENSOR_ROW_FIELDS
 
 SAMPLE_A = {
   "timestamp": "2022-02-04T14:24:12.456Z",
@@ -91,6 +91,7 @@ def _assert_sample_formats(sample_payload):
     sensor_rows = formatted["sensors"]
 
     assert isinstance(packet_row["timestamp"], datetime)
+    assert packet_row["timestamp"].tzinfo is not None
     assert packet_row["session_id"] == sample_payload["session_id"]
     assert packet_row["vehicle_id"] == sample_payload["vehicle_id"]
 
@@ -102,7 +103,10 @@ def _assert_sample_formats(sample_payload):
     assert reconstructed_payload == sample_payload
 
     assert len(sensor_rows) == len(sample_payload["sensors"])
-    sensor_rows_by_name = {row["sensor_name"]: row for row in sensor_rows}
+    sensor_rows_by_name = {
+        row[SENSOR_ROW_FIELDS.index("sensor_name")]: dict(zip(SENSOR_ROW_FIELDS, row))
+        for row in sensor_rows
+    }
 
     for sensor_name, expected_value in sample_payload["sensors"].items():
         assert sensor_name in sensor_rows_by_name
@@ -126,3 +130,27 @@ def test_parse_accepts_json_string():
     parsed_payload = parse(json_text)
     formatted = format(parsed_payload)
     assert formatted["packet"]["session_id"] == SAMPLE_A["session_id"]
+
+def test_format_forwards_original_json_text():
+    json_text = json.dumps(SAMPLE_A, indent=2)
+    formatted = format(parse(json_text))
+    assert formatted["packet"]["raw_payload"] == json_text
+    assert parse(SAMPLE_A)["raw_json"] is None
+
+def test_parse_accepts_json_bytes():
+    json_bytes = json.dumps(SAMPLE_B).encode("utf-8")
+    parsed_payload = parse(json_bytes)
+    formatted = format(parsed_payload)
+    assert formatted["packet"]["session_id"] == SAMPLE_B["session_id"]
+    assert json.loads(formatted["packet"]["raw_payload"]) == SAMPLE_B
+
+def test_format_handles_partial_sensor_map():
+    payload = dict(SAMPLE_C, sensors={"engine_rpm": 9100, "oil_temp": 101.5})
+    _assert_sample_formats(payload)
+
+def test_parse_timestamps_are_utc_aware():
+    epoch_payload = dict(SAMPLE_A, timestamp=1643984652.456)
+    assert parse(epoch_payload)["timestamp"] == datetime(2022, 2, 4, 14, 24, 12, 456000, tzinfo=timezone.utc)
+
+    naive_payload = dict(SAMPLE_A, timestamp="2022-02-04T14:24:12.456")
+    assert parse(naive_payload)["timestamp"] == parse(SAMPLE_A)["timestamp"]
@@ -2,12 +2,19 @@
 Unit tests for the Formula SAE Telemetry JSON Validator Module
 """
 
+import enum
+from collections import OrderedDict
+import json
 import unittest
 from validator import (
     validate_payload,
+    validate_payload_fast,
     validate_sensors,
+    validate_sensors_batch,
     validate_metadata,
     validate_timestamp,
+    _validate_timestamp_str,
+    _BATCH_VECTORIZE_MIN,
 )
 
 
@@ -34,6 +41,8 @@ class TestValidateTimestamp(unittest.TestCase):
             "10:30:00",             # Missing date
             "2024/01/15 10:30:00",  # Wrong separator
             "not-a-timestamp",
+            "2024-13-15T10:30:00Z", # Month out of range
+            "2024-01-15T10:30:00Z\n",
         ]
         for ts in invalid_timestamps:
             is_valid, error = validate_timestamp(ts)
@@ -46,6 +55,20 @@ class TestValidateTimestamp(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertIn("must be a string", error)
 
+    def test_repeated_timestamp_uses_cache(self):
+        """Test repeated timestamps give the same result from the cache"""
+        ts = "2024-01-15T10:30:00.010Z"
+        first = validate_timestamp(ts)
+        hits = _validate_timestamp_str.cache_info().hits
+        self.assertEqual(validate_timestamp(ts), first)
+        self.assertEqual(_validate_timestamp_str.cache_info().hits, hits + 1)
+
+    def test_unhashable_timestamp(self):
+        """Test unhashable timestamp values are rejected, not cached"""
+        is_valid, error = validate_timestamp(["2024-01-15T10:30:00Z"])
+        self.assertFalse(is_valid)
+        self.assertIn("must be a string", error)
+
 
 class TestValidateSensors(unittest.TestCase):
     """Test cases for sensor data validation"""
@@ -94,6 +117,49 @@ class TestValidateSensors(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertTrue(any("must be a number" in e for e in errors))
 
+    def test_bool_sensor_value_rejected(self):
+        """Test booleans are not accepted as numeric sensor values"""
+        sensor_data = {**self.valid_sensor_data, "engine_rpm": True}
+        is_valid, errors = validate_sensors(sensor_data)
+        self.assertFalse(is_valid)
+        self.assertIn("Sensors: engine_rpm must be a number (int or float), got bool", errors)
+
+    def test_fast_fail_stops_at_first_error(self):
+        """Test fast_fail returns only the first error"""
+        sensor_data = {**self.valid_sensor_data, "engine_rpm": 25000, "coolant_temp": 500}
+        is_valid, errors = validate_sensors(sensor_data)
+        self.assertFalse(is_valid)
+        self.assertEqual(len(errors), 2)
+        is_valid, errors = validate_sensors(sensor_data, fast_fail=True)
+        self.assertFalse(is_valid)
+        self.assertEqual(len(errors), 1)
+
+    def test_sensor_batch_flags_invalid_entries(self):
+        """Test batch validation returns the indices of invalid entries"""
+        batch = [
+            self.valid_sensor_data,
+            {**self.valid_sensor_data, "engine_rpm": 25000},
+            {k: v for k, v in self.valid_sensor_data.items() if k != "speed_fl"},
+            {**self.valid_sensor_data, "coolant_temp": "hot"},
+            None,
+            self.valid_sensor_data,
+        ]
+        self.assertEqual(validate_sensors_batch(batch), [1, 2, 3, 4])
+        # Padded past the size where the vectorized path takes over
+        padded = batch + [self.valid_sensor_data] * _BATCH_VECTORIZE_MIN
+        self.assertEqual(validate_sensors_batch(padded), [1, 2, 3, 4])
+        self.assertEqual(validate_sensors_batch([]), [])
+
+    def test_sensor_batch_matches_validate_sensors(self):
+        """Test large batches agree with validate_sensors on dict subclasses and huge ints"""
+        batch = [dict(self.valid_sensor_data) for _ in range(_BATCH_VECTORIZE_MIN)]
+        batch[3] = OrderedDict(self.valid_sensor_data)
+        batch[5]["engine_rpm"] = 10**400
+        batch[7]["steering_angle"] = -10**400
+        expected = [index for index, entry in enumerate(batch) if not validate_sensors(entry)[0]]
+        self.assertEqual(expected, [5, 7])
+        self.assertEqual(validate_sensors_batch(batch), expected)
+
     def test_rpm_out_of_range(self):
         """Test RPM value out of acceptable range"""
         sensor_data = {**self.valid_sensor_data, "engine_rpm": 25000}
@@ -137,6 +203,15 @@ class TestValidateMetadata(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertTrue(any("packet_id" in e for e in errors))
 
+    def test_missing_fields_reported_in_schema_order(self):
+        """Test missing-field errors follow the schema order"""
+        is_valid, errors = validate_metadata({"daq_version": "v2.1.3"})
+        self.assertFalse(is_valid)
+        self.assertEqual(errors, [
+            "Telemetry metadata missing required field: 'packet_id'",
+            "Telemetry metadata missing required field: 'sample_rate_hz'",
+        ])
+
     def test_invalid_sample_rate(self):
         """Test invalid sample rate"""
         metadata = {**self.valid_metadata, "sample_rate_hz": -50}
@@ -182,6 +257,88 @@ class TestValidatePayload(unittest.TestCase):
         is_valid, errors = validate_payload(self.valid_payload)
         self.assertTrue(is_valid)
         self.assertEqual(len(errors), 0)
+
+    def test_valid_payload_json_bytes(self):
+        """Test valid payload as raw JSON bytes"""
+        is_valid, errors = validate_payload(json.dumps(self.valid_payload).encode("utf-8"))
+        self.assertTrue(is_valid)
+        self.assertEqual(len(errors), 0)
+
+    def test_invalid_payload_reports_all_errors(self):
+        """Test rejected payloads still get every detailed error"""
+        payload = {**self.valid_payload, "session_id": " "}
+        payload["sensors"] = {**payload["sensors"], "engine_rpm": 25000}
+        is_valid, errors = validate_payload(payload)
+        self.assertFalse(is_valid)
+        self.assertIn("Payload: session_id cannot be empty", errors)
+        self.assertTrue(any("engine_rpm" in e and "out of range" in e for e in errors))
+
+    def test_validate_payload_fast(self):
+        """Test boolean fast path agrees with validate_payload"""
+        self.assertTrue(validate_payload_fast(self.valid_payload))
+        payload = {**self.valid_payload, "vehicle_id": ""}
+        self.assertFalse(validate_payload_fast(payload))
+        payload = {**self.valid_payload, "telemetry_metadata": {"packet_id": "pkt_1"}}
+        self.assertFalse(validate_payload_fast(payload))
+
+    def test_fast_fail_checks_timestamp_last(self):
+        """Test structural errors are reported before the timestamp is parsed"""
+        payload = {**self.valid_payload, "timestamp": "2024-13-15T10:30:00Z", "sensors": "bad"}
+        is_valid, errors = validate_payload(payload, fast_fail=True)
+        self.assertFalse(is_valid)
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Sensor data must be a dictionary", errors[0])
+        is_valid, errors = validate_payload(payload)
+        self.assertEqual(len(errors), 2)
+        self.assertIn("timestamp", errors[-1].lower())
+
+    def test_type_rule_matches_sub_validators(self):
+        """Test subclasses are rejected the same way by validate_payload and the sub-validators"""
+        class Rpm(enum.IntEnum):
+            IDLE = 5000
+
+        class Name(str):
+            pass
+
+        sensors = {**self.valid_payload["sensors"], "engine_rpm": Rpm.IDLE}
+        payload = {**self.valid_payload, "sensors": sensors}
+        self.assertFalse(validate_sensors(sensors)[0])
+        self.assertFalse(validate_payload(payload)[0])
+        self.assertFalse(validate_payload_fast(payload))
+
+        payload = {**self.valid_payload, "session_id": Name("session_001")}
+        self.assertFalse(validate_payload(payload)[0])
+
+        metadata = {**self.valid_payload["telemetry_metadata"], "sample_rate_hz": True}
+        payload = {**self.valid_payload, "telemetry_metadata": metadata}
+        self.assertFalse(validate_metadata(metadata)[0])
+        self.assertFalse(validate_payload(payload)[0])
+
+    def test_ordered_dict_payload(self):
+        """Test dict subclasses are accepted as payloads"""
+        payload = OrderedDict(self.valid_payload)
+        self.assertEqual(validate_payload(payload), (True, ()))
+        self.assertTrue(validate_payload_fast(payload))
+
+    def test_invalid_json(self):
+        """Test malformed JSON text"""
+        is_valid, errors = validate_payload('{"timestamp": ')
+        self.assertFalse(is_valid)
+        self.assertIn("Invalid JSON format", errors[0])
+
+    def test_invalid_json_bytes(self):
+        """Test malformed JSON and UTF-8 bytes"""
+        for raw in (b'{"timestamp": ', b'{"session_id": "\xff"}', bytearray(b'[1, 2')):
+            is_valid, errors = validate_payload(raw)
+            self.assertFalse(is_valid)
+            self.assertIn("Invalid JSON format", errors[0])
+
+    def test_non_object_json(self):
+        """Test JSON that decodes to something other than an object"""
+        for raw in ('[1, 2]', b'3', b'null'):
+            is_valid, errors = validate_payload(raw)
+            self.assertFalse(is_valid)
+            self.assertIn("Payload must be a JSON object", errors[0])
     
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
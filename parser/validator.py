@@ -5,9 +5,28 @@ This module provides validation functions for JSON payloads containing
 Formula SAE racing car telemetry data before entering the data pipeline.
 """
 
-import json
+import operator
+import re
+import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from functools import lru_cache
+from typing import Dict, List, Any, Sequence, Tuple
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class ValidationError(Exception):
@@ -15,224 +34,465 @@ class ValidationError(Exception):
     pass
 
 
-def validate_timestamp(timestamp_str: str) -> Tuple[bool, str]:
+@dataclass(frozen=True, slots=True)
+class _Error:
+    """Validation error kept as a message template and its arguments until it is shown."""
+    template: str
+    args: Tuple[Any, ...] = ()
+    
+    def __str__(self) -> str:
+        return self.template.format(*self.args) if self.args else self.template
+
+
+def _format_errors(errors: Sequence[_Error]) -> List[str]:
+    """Materialize error records into the messages the public API returns."""
+    return [str(error) for error in errors]
+
+
+# FSAE sensor schema, built once at import: (field, min_value, max_value, description)
+_FSAE_SENSOR_SPEC = (
+    ('engine_rpm', 0, 14000, "RPM must be between 0 and 14000"),
+    ('throttle_position', 0, 100, "Throttle position must be between 0 and 100 percent"),
+    ('brake_pressure', 0, 2000, "Brake pressure must be between 0 and 2000 bar/psi"),
+    ('coolant_temp', 20, 120, "Coolant temperature must be between 20 and 120 degrees C"),
+    ('oil_pressure', 0, 100, "Oil pressure must be between 0 and 100 psi"),
+    ('intake_air_temp', -10, 80, "Intake air temperature must be between -10 and 80 degrees C"),
+    ('battery_voltage', 10, 15, "Battery voltage must be between 10 and 15 volts"),
+    ('speed_fl', 0, 45, "Front left wheel speed must be between 0 and 45 mph"),
+    ('speed_fr', 0, 45, "Front right wheel speed must be between 0 and 45 mph"),
+    ('speed_rl', 0, 45, "Rear left wheel speed must be between 0 and 45 mph"),
+    ('speed_rr', 0, 45, "Rear right wheel speed must be between 0 and 45 mph"),
+    ('steering_angle', -540, 540, "Steering angle must be between -540 and 540 degrees"),
+    ('accel_lateral', -3, 3, "Lateral acceleration must be between -3 and 3 g"),
+    ('accel_longitudinal', -3, 3, "Longitudinal acceleration must be between -3 and 3 g"),
+)
+
+# Every sensor in the schema is required
+_SENSOR_REQUIRED_FIELDS = tuple(spec[0] for spec in _FSAE_SENSOR_SPEC)
+_METADATA_REQUIRED_FIELDS = ('packet_id', 'sample_rate_hz', 'daq_version')
+_PAYLOAD_REQUIRED_FIELDS = ('timestamp', 'session_id', 'vehicle_id', 'sensors', 'telemetry_metadata')
+
+# Set versions for the missing-field check; the tuples above keep error order stable
+_SENSOR_REQUIRED_SET = frozenset(_SENSOR_REQUIRED_FIELDS)
+_METADATA_REQUIRED_SET = frozenset(_METADATA_REQUIRED_FIELDS)
+_PAYLOAD_REQUIRED_SET = frozenset(_PAYLOAD_REQUIRED_FIELDS)
+
+# Sensor values in schema order, read with one C-level call when nothing is missing
+_SENSOR_GETTER = operator.itemgetter(*_SENSOR_REQUIRED_FIELDS)
+_SENSOR_LOWER_BOUNDS = tuple(spec[1] for spec in _FSAE_SENSOR_SPEC)
+_SENSOR_UPPER_BOUNDS = tuple(spec[2] for spec in _FSAE_SENSOR_SPEC)
+_NUMERIC_TYPES = frozenset((int, float))
+
+
+def _build_range_mask():
     """
-    Validate that a timestamp is in valid ISO 8601 format.
+    Generate _range_mask with the schema bounds inlined as constants.
     
-    Args:
-        timestamp_str: String to validate as ISO 8601 timestamp
-        
-    Returns:
-        Tuple of (is_valid, error_message)
+    The generated function sets bit i when values[i] is outside the bounds of
+    sensor i, evaluating every bound without early exit. Inlining the constants
+    avoids the loop, tuple unpacking and bound lookups of an interpreted version.
     """
-    if not isinstance(timestamp_str, str):
-        return False, f"Timestamp must be a string, got {type(timestamp_str).__name__}"
+    names = [f"v{index}" for index in range(len(_FSAE_SENSOR_SPEC))]
+    terms = [
+        f"(({name} < {lower!r}) | ({name} > {upper!r})) << {index}"
+        for index, (name, (_, lower, upper, _)) in enumerate(zip(names, _FSAE_SENSOR_SPEC))
+    ]
+    source = (
+        "def _range_mask(values):\n"
+        f"    {', '.join(names)}, = values\n"
+        f"    return ({' | '.join(terms)})\n"
+    )
+    namespace = {}
+    exec(compile(source, '<validator _range_mask>', 'exec'), namespace)
+    return namespace['_range_mask']
+
+
+_range_mask = _build_range_mask()
+
+
+# Missing-field errors only depend on the field name, so build them once
+_SENSOR_MISSING_ERRORS = {field: _Error(f"Sensors missing required field: '{field}'") for field in _SENSOR_REQUIRED_FIELDS}
+_METADATA_MISSING_ERRORS = {field: _Error(f"Telemetry metadata missing required field: '{field}'") for field in _METADATA_REQUIRED_FIELDS}
+_PAYLOAD_MISSING_ERRORS = {field: _Error(f"Payload missing required field: '{field}'") for field in _PAYLOAD_REQUIRED_FIELDS}
+
+# Accepted layout: YYYY-MM-DDTHH:MM[:SS[.fraction]][Z|+HH:MM|-HH:MM]
+_ISO8601_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?')
+
+# Range bounds in schema order, for the vectorized batch check
+if np is not None:
+    _SENSOR_MIN = np.array([spec[1] for spec in _FSAE_SENSOR_SPEC], dtype=np.float64)
+    _SENSOR_MAX = np.array([spec[2] for spec in _FSAE_SENSOR_SPEC], dtype=np.float64)
+
+# Shared error sequence for valid results, so the happy path returns no fresh list
+_EMPTY: Tuple[str, ...] = ()
+
+# Default for dict.get when a key may be absent (None is a legitimate JSON value)
+_MISSING = object()
+
+_fromisoformat = datetime.fromisoformat
+
+if _parse_datetime is None:
+    def _parse_iso(timestamp_str: str) -> datetime:
+        return _fromisoformat(timestamp_str.replace('Z', '+00:00'))
+else:
+    _parse_iso = _parse_datetime
+
+
+@lru_cache(maxsize=4096)
+def _validate_timestamp_str(timestamp_str: str) -> Tuple[bool, str]:
+    """
+    Format checks for validate_timestamp, memoized per string.
     
+    Packets sampled at a fixed rate repeat the same timestamp strings,
+    so each distinct string is only parsed once.
+    """
     # Check that timestamp contains time component (has 'T' separator)
     if 'T' not in timestamp_str:
         return False, f"Invalid ISO 8601 timestamp format: {timestamp_str}. Must include time component (e.g., 2024-01-15T10:30:00Z)"
     
+    # Reject malformed layouts with the regex before paying for a parse attempt
+    if _ISO8601_RE.fullmatch(timestamp_str) is None:
+        return False, f"Invalid ISO 8601 timestamp format: {timestamp_str}. Expected YYYY-MM-DDTHH:MM:SS with optional fraction and offset"
+    
     try:
-        # Try parsing as ISO 8601 format
-        datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        # Parse to catch out-of-range dates and times (e.g. month 13)
+        _parse_iso(timestamp_str)
         return True, ""
     except ValueError as e:
         return False, f"Invalid ISO 8601 timestamp format: {timestamp_str}. Error: {str(e)}"
 
 
-def validate_sensors(sensor_data: Any) -> Tuple[bool, List[str]]:
+def validate_timestamp(timestamp_str: str) -> Tuple[bool, str]:
     """
-    Validate racing sensor readings data.
+    Validate that a timestamp is in valid ISO 8601 format.
     
     Args:
-        sensor_data: Sensor data dictionary to validate
+        timestamp_str: String to validate as ISO 8601 timestamp
         
     Returns:
-        Tuple of (is_valid, list_of_error_messages)
+        Tuple of (is_valid, error_message)
     """
+    # Type check stays outside the cache so unhashable values never reach it
+    if type(timestamp_str) is not str:
+        return False, f"Timestamp must be a string, got {type(timestamp_str).__name__}"
+    
+    return _validate_timestamp_str(timestamp_str)
+
+
+def _sensors_errors(sensor_data: Any, fast_fail: bool) -> Sequence[_Error]:
+    """Error records for validate_sensors; messages are only formatted by the caller."""
     errors = []
     
     # Check if sensor_data exists
     if sensor_data is None:
-        errors.append("Sensor data is missing")
-        return False, errors
+        errors.append(_Error("Sensor data is missing"))
+        return errors
     
     # Check if sensor_data is a dictionary
     if not isinstance(sensor_data, dict):
-        errors.append(f"Sensor data must be a dictionary, got {type(sensor_data).__name__}")
-        return False, errors
-    
-    # Define required sensor fields for FSAE telemetry
-    required_fields = [
-        'engine_rpm',
-        'throttle_position',
-        'brake_pressure',
-        'coolant_temp',
-        'oil_pressure',
-        'intake_air_temp',
-        'battery_voltage',
-        'speed_fl',
-        'speed_fr',
-        'speed_rl',
-        'speed_rr',
-        'steering_angle',
-        'accel_lateral',
-        'accel_longitudinal'
-    ]
+        errors.append(_Error("Sensor data must be a dictionary, got {}", (type(sensor_data).__name__,)))
+        return errors
+    
+    errors_append = errors.append
+    
+    # Check for required fields (one set difference; walk the schema only if some are missing)
+    missing = _SENSOR_REQUIRED_SET.difference(sensor_data)
+    if missing:
+        for field in _SENSOR_REQUIRED_FIELDS:
+            if field in missing:
+                errors_append(_SENSOR_MISSING_ERRORS[field])
+                if fast_fail:
+                    return errors
+    
+    # Validate each sensor field: all range checks go into one bitmask, and the
+    # per-field messages are only built for the bits that are set
+    if missing:
+        sensor_get = sensor_data.get
+        values = tuple(sensor_get(field, _MISSING) for field in _SENSOR_REQUIRED_FIELDS)
+    else:
+        values = _SENSOR_GETTER(sensor_data)
+    
+    # Numeric means exact int/float, so bools are rejected
+    if _NUMERIC_TYPES.issuperset(map(type, values)):
+        type_mask = 0
+        mask = _range_mask(values)
+    else:
+        # Stand in a lower bound for missing/non-numeric values so only real readings set range bits
+        type_mask = 0
+        checked = list(values)
+        for index, value in enumerate(values):
+            value_type = type(value)
+            if value_type is not float and value_type is not int:
+                if value is not _MISSING:
+                    type_mask |= 1 << index
+                checked[index] = _SENSOR_LOWER_BOUNDS[index]
+        mask = _range_mask(checked) | type_mask
+    
+    # Lowest bit first, i.e. schema order
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        index = bit.bit_length() - 1
+        field, _, _, description = _FSAE_SENSOR_SPEC[index]
+        value = values[index]
+        if type_mask & bit:
+            errors_append(_Error("Sensors: {} must be a number (int or float), got {}", (field, type(value).__name__)))
+        else:
+            errors_append(_Error("Sensors: {} value {} is out of range. {}", (field, value, description)))
+        if fast_fail:
+            return errors
     
-    # Check for required fields
-    for field in required_fields:
-        if field not in sensor_data:
-            errors.append(f"Sensors missing required field: '{field}'")
-    
-    # Define validation rules: (min_value, max_value, description)
-    sensor_validations = {
-        'engine_rpm': (0, 14000, "RPM must be between 0 and 14000"),
-        'throttle_position': (0, 100, "Throttle position must be between 0 and 100 percent"),
-        'brake_pressure': (0, 2000, "Brake pressure must be between 0 and 2000 bar/psi"),
-        'coolant_temp': (20, 120, "Coolant temperature must be between 20 and 120 degrees C"),
-        'oil_pressure': (0, 100, "Oil pressure must be between 0 and 100 psi"),
-        'intake_air_temp': (-10, 80, "Intake air temperature must be between -10 and 80 degrees C"),
-        'battery_voltage': (10, 15, "Battery voltage must be between 10 and 15 volts"),
-        'speed_fl': (0, 45, "Front left wheel speed must be between 0 and 45 mph"),
-        'speed_fr': (0, 45, "Front right wheel speed must be between 0 and 45 mph"),
-        'speed_rl': (0, 45, "Rear left wheel speed must be between 0 and 45 mph"),
-        'speed_rr': (0, 45, "Rear right wheel speed must be between 0 and 45 mph"),
-        'steering_angle': (-540, 540, "Steering angle must be between -540 and 540 degrees"),
-        'accel_lateral': (-3, 3, "Lateral acceleration must be between -3 and 3 g"),
-        'accel_longitudinal': (-3, 3, "Longitudinal acceleration must be between -3 and 3 g")
-    }
-    
-    # Validate each sensor field
-    for field, (min_val, max_val, description) in sensor_validations.items():
-        if field in sensor_data:
-            value = sensor_data[field]
-            
-            # Check if value is numeric
-            if not isinstance(value, (int, float)):
-                errors.append(f"Sensors: {field} must be a number (int or float), got {type(value).__name__}")
-            else:
-                # Check range
-                if value < min_val or value > max_val:
-                    errors.append(f"Sensors: {field} value {value} is out of range. {description}")
-    
-    return len(errors) == 0, errors
-
-
-def validate_metadata(metadata: Any) -> Tuple[bool, List[str]]:
+    return errors or _EMPTY
+
+
+def validate_sensors(sensor_data: Any, fast_fail: bool = False) -> Tuple[bool, Sequence[str]]:
     """
-    Validate telemetry metadata fields.
+    Validate racing sensor readings data.
     
     Args:
-        metadata: Metadata dictionary to validate
+        sensor_data: Sensor data dictionary to validate
+        fast_fail: Stop at the first error instead of collecting all of them
         
     Returns:
         Tuple of (is_valid, list_of_error_messages)
     """
+    errors = _sensors_errors(sensor_data, fast_fail)
+    if errors:
+        return False, _format_errors(errors)
+    return True, _EMPTY
+
+
+# Below this many packets the per-packet loop beats filling the NumPy array
+# (measured crossover is around 48 packets)
+_BATCH_VECTORIZE_MIN = 64
+
+_FLOAT_MAX = sys.float_info.max
+
+
+def _sensor_value_or_inf(sensor_data: Any, field: str) -> float:
+    """Numeric sensor value, or +inf (always out of range) if missing, not a number or too big for a float."""
+    value = sensor_data.get(field) if isinstance(sensor_data, dict) else None
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int and -_FLOAT_MAX <= value <= _FLOAT_MAX:
+        return value
+    return float('inf')
+
+
+def validate_sensors_batch(sensor_batch: List[Any]) -> List[int]:
+    """
+    Find the invalid entries in a batch of sensor readings.
+    
+    Applies the same required-field, type and range rules as validate_sensors
+    to many packets at once. With NumPy installed and at least
+    _BATCH_VECTORIZE_MIN packets, the range check is a single vectorized
+    comparison over an (N, n_sensors) array; smaller batches are checked one
+    packet at a time, which is faster below that size.
+    
+    Args:
+        sensor_batch: List of sensor data dictionaries
+        
+    Returns:
+        Indices of the invalid entries, in ascending order (use validate_sensors
+        on those entries for the error messages)
+    """
+    if np is None or len(sensor_batch) < _BATCH_VECTORIZE_MIN:
+        return [index for index, sensor_data in enumerate(sensor_batch)
+                if _sensors_errors(sensor_data, True)]
+    
+    values = np.empty((len(sensor_batch), len(_FSAE_SENSOR_SPEC)), dtype=np.float64)
+    for column, field in enumerate(_SENSOR_REQUIRED_FIELDS):
+        values[:, column] = np.fromiter(
+            (_sensor_value_or_inf(sensor_data, field) for sensor_data in sensor_batch),
+            dtype=np.float64,
+            count=len(sensor_batch),
+        )
+    
+    out_of_range = (values < _SENSOR_MIN) | (values > _SENSOR_MAX)
+    return np.flatnonzero(out_of_range.any(axis=1)).tolist()
+
+
+def _metadata_errors(metadata: Any, fast_fail: bool) -> Sequence[_Error]:
+    """Error records for validate_metadata; messages are only formatted by the caller."""
     errors = []
     
     # Check if metadata exists
     if metadata is None:
-        errors.append("Telemetry metadata is missing")
-        return False, errors
+        errors.append(_Error("Telemetry metadata is missing"))
+        return errors
     
     # Check if metadata is a dictionary
     if not isinstance(metadata, dict):
-        errors.append(f"Telemetry metadata must be a dictionary, got {type(metadata).__name__}")
-        return False, errors
+        errors.append(_Error("Telemetry metadata must be a dictionary, got {}", (type(metadata).__name__,)))
+        return errors
     
     # Required metadata fields
-    required_fields = ['packet_id', 'sample_rate_hz', 'daq_version']
-    for field in required_fields:
-        if field not in metadata:
-            errors.append(f"Telemetry metadata missing required field: '{field}'")
+    missing = _METADATA_REQUIRED_SET.difference(metadata)
+    if missing:
+        for field in _METADATA_REQUIRED_FIELDS:
+            if field in missing:
+                errors.append(_METADATA_MISSING_ERRORS[field])
+                if fast_fail:
+                    return errors
     
     # Validate packet_id
-    if 'packet_id' in metadata:
-        if not isinstance(metadata['packet_id'], str):
-            errors.append("Telemetry metadata: packet_id must be a string")
-        elif not metadata['packet_id'].strip():
-            errors.append("Telemetry metadata: packet_id cannot be empty")
+    packet_id = metadata.get('packet_id', _MISSING)
+    if packet_id is not _MISSING:
+        if type(packet_id) is not str:
+            errors.append(_Error("Telemetry metadata: packet_id must be a string"))
+        elif not packet_id or packet_id.isspace():
+            errors.append(_Error("Telemetry metadata: packet_id cannot be empty"))
+        if fast_fail and errors:
+            return errors
     
     # Validate sample_rate_hz
-    if 'sample_rate_hz' in metadata:
-        if not isinstance(metadata['sample_rate_hz'], (int, float)):
-            errors.append("Telemetry metadata: sample_rate_hz must be a number")
-        elif metadata['sample_rate_hz'] <= 0:
-            errors.append(f"Telemetry metadata: sample_rate_hz must be positive, got {metadata['sample_rate_hz']}")
-        elif metadata['sample_rate_hz'] > 10000:
-            errors.append(f"Telemetry metadata: sample_rate_hz {metadata['sample_rate_hz']} exceeds maximum (10000 Hz)")
+    sample_rate_hz = metadata.get('sample_rate_hz', _MISSING)
+    if sample_rate_hz is not _MISSING:
+        sample_rate_type = type(sample_rate_hz)
+        if sample_rate_type is not int and sample_rate_type is not float:
+            errors.append(_Error("Telemetry metadata: sample_rate_hz must be a number"))
+        elif sample_rate_hz <= 0:
+            errors.append(_Error("Telemetry metadata: sample_rate_hz must be positive, got {}", (sample_rate_hz,)))
+        elif sample_rate_hz > 10000:
+            errors.append(_Error("Telemetry metadata: sample_rate_hz {} exceeds maximum (10000 Hz)", (sample_rate_hz,)))
+        if fast_fail and errors:
+            return errors
     
     # Validate daq_version
-    if 'daq_version' in metadata:
-        if not isinstance(metadata['daq_version'], str):
-            errors.append("Telemetry metadata: daq_version must be a string")
+    daq_version = metadata.get('daq_version', _MISSING)
+    if daq_version is not _MISSING:
+        if type(daq_version) is not str:
+            errors.append(_Error("Telemetry metadata: daq_version must be a string"))
     
-    return len(errors) == 0, errors
+    return errors or _EMPTY
 
 
-def validate_payload(json_data: Any) -> Tuple[bool, List[str]]:
+def validate_metadata(metadata: Any, fast_fail: bool = False) -> Tuple[bool, Sequence[str]]:
     """
-    Validate complete FSAE telemetry payload structure.
+    Validate telemetry metadata fields.
     
     Args:
-        json_data: JSON payload to validate (can be dict or JSON string)
+        metadata: Metadata dictionary to validate
+        fast_fail: Stop at the first error instead of collecting all of them
         
     Returns:
         Tuple of (is_valid, list_of_error_messages)
     """
+    errors = _metadata_errors(metadata, fast_fail)
+    if errors:
+        return False, _format_errors(errors)
+    return True, _EMPTY
+
+
+def _payload_errors(json_data: Any, fast_fail: bool) -> Sequence[_Error]:
+    """Error records for validate_payload; messages are only formatted by the caller."""
     errors = []
     
-    # If json_data is a string, try to parse it
-    if isinstance(json_data, str):
+    # If json_data is a string or raw bytes, try to parse it
+    if isinstance(json_data, (str, bytes, bytearray)):
         try:
-            data = json.loads(json_data)
-        except json.JSONDecodeError as e:
-            errors.append(f"Invalid JSON format: {str(e)}")
-            return False, errors
+            data = _json_loads(json_data)
+        except ValueError as e:
+            # JSONDecodeError from orjson/json, or UnicodeDecodeError from json for bad bytes
+            errors.append(_Error("Invalid JSON format: {}", (str(e),)))
+            return errors
     elif isinstance(json_data, dict):
         data = json_data
     else:
-        errors.append(f"Payload must be a JSON string or dictionary, got {type(json_data).__name__}")
-        return False, errors
+        errors.append(_Error("Payload must be a JSON string or dictionary, got {}", (type(json_data).__name__,)))
+        return errors
+    
+    # JSON text can decode to a list or scalar
+    if not isinstance(data, dict):
+        errors.append(_Error("Payload must be a JSON object, got {}", (type(data).__name__,)))
+        return errors
+    
+    # Checks run cheapest first: required keys, ids, sensors, metadata, then the timestamp
     
     # Check for required top-level fields
-    required_fields = ['timestamp', 'session_id', 'vehicle_id', 'sensors', 'telemetry_metadata']
-    for field in required_fields:
-        if field not in data:
-            errors.append(f"Payload missing required field: '{field}'")
-    
-    # Validate timestamp
-    if 'timestamp' in data:
-        is_valid, error_msg = validate_timestamp(data['timestamp'])
-        if not is_valid:
-            errors.append(f"Payload: {error_msg}")
+    missing = _PAYLOAD_REQUIRED_SET.difference(data)
+    if missing:
+        for field in _PAYLOAD_REQUIRED_FIELDS:
+            if field in missing:
+                errors.append(_PAYLOAD_MISSING_ERRORS[field])
+                if fast_fail:
+                    return errors
     
     # Validate session_id
-    if 'session_id' in data:
-        if not isinstance(data['session_id'], str):
-            errors.append("Payload: session_id must be a string")
-        elif not data['session_id'].strip():
-            errors.append("Payload: session_id cannot be empty")
+    session_id = data.get('session_id', _MISSING)
+    if session_id is not _MISSING:
+        if type(session_id) is not str:
+            errors.append(_Error("Payload: session_id must be a string"))
+        elif not session_id or session_id.isspace():
+            errors.append(_Error("Payload: session_id cannot be empty"))
+        if fast_fail and errors:
+            return errors
     
     # Validate vehicle_id
-    if 'vehicle_id' in data:
-        if not isinstance(data['vehicle_id'], str):
-            errors.append("Payload: vehicle_id must be a string")
-        elif not data['vehicle_id'].strip():
-            errors.append("Payload: vehicle_id cannot be empty")
+    vehicle_id = data.get('vehicle_id', _MISSING)
+    if vehicle_id is not _MISSING:
+        if type(vehicle_id) is not str:
+            errors.append(_Error("Payload: vehicle_id must be a string"))
+        elif not vehicle_id or vehicle_id.isspace():
+            errors.append(_Error("Payload: vehicle_id cannot be empty"))
+        if fast_fail and errors:
+            return errors
     
     # Validate sensors
-    if 'sensors' in data:
-        is_valid, sensor_errors = validate_sensors(data['sensors'])
-        errors.extend(sensor_errors)
+    sensors = data.get('sensors', _MISSING)
+    if sensors is not _MISSING:
+        errors.extend(_sensors_errors(sensors, fast_fail))
+        if fast_fail and errors:
+            return errors
     
     # Validate telemetry_metadata
-    if 'telemetry_metadata' in data:
-        is_valid, metadata_errors = validate_metadata(data['telemetry_metadata'])
-        errors.extend(metadata_errors)
+    telemetry_metadata = data.get('telemetry_metadata', _MISSING)
+    if telemetry_metadata is not _MISSING:
+        errors.extend(_metadata_errors(telemetry_metadata, fast_fail))
+        if fast_fail and errors:
+            return errors
+    
+    # Validate timestamp last: parsing it is the most expensive check, so in
+    # fast_fail mode structurally bad packets are rejected before reaching it
+    timestamp = data.get('timestamp', _MISSING)
+    if timestamp is not _MISSING:
+        is_valid, error_msg = validate_timestamp(timestamp)
+        if not is_valid:
+            errors.append(_Error("Payload: {}", (error_msg,)))
+    
+    return errors or _EMPTY
+
+
+def validate_payload(json_data: Any, fast_fail: bool = False) -> Tuple[bool, Sequence[str]]:
+    """
+    Validate complete FSAE telemetry payload structure.
     
-    return len(errors) == 0, errors
+    Args:
+        json_data: JSON payload to validate (can be dict, JSON string or JSON bytes)
+        fast_fail: Stop at the first error instead of collecting all of them
+        
+    Returns:
+        Tuple of (is_valid, list_of_error_messages)
+    """
+    errors = _payload_errors(json_data, fast_fail)
+    if errors:
+        return False, _format_errors(errors)
+    return True, _EMPTY
+
+
+def validate_payload_fast(json_data: Any) -> bool:
+    """
+    Check a payload for packet triage, stopping at the first error.
+    
+    Args:
+        json_data: JSON payload to validate (can be dict, JSON string or JSON bytes)
+        
+    Returns:
+        True if the payload is valid
+    """
+    # Only the validity is needed, so the error records are never formatted
+    return not _payload_errors(json_data, True)
 
 
 def validate_payload_strict(json_data: Any) -> Dict[str, Any]:
@@ -240,9 +500,9 @@ def validate_payload_strict(json_data: Any) -> Dict[str, Any]:
     Validate payload and raise ValidationError if invalid.
     
     """
-    is_valid, errors = validate_payload(json_data)
+    errors = _payload_errors(json_data, False)
     
-    if not is_valid:
+    if errors:
         error_message = "Validation failed:\n" + "\n".join(f"  - {error}" for error in errors)
         raise ValidationError(error_message)
     